@@ -38,6 +38,8 @@ Examples:
 
 """
 
+import re
+
 from insights.core.plugins import combiner
 from insights.parsers.installed_rpms import InstalledRpms
 from insights.parsers.dmidecode import DMIDecode
@@ -45,6 +47,29 @@ from insights.parsers.yum import YumRepoList
 from insights.parsers.rhsm_conf import RHSMConf
 
 
+def _dmi_detection_fields(dmidcd):
+    """
+    dict: The DMI fields used for cloud provider detection, pulled out in a
+    single walk of the ``DMIDecode`` structure so each provider check is a
+    plain dict access instead of a re-traversal.
+    """
+    fields = dict.fromkeys(
+        ('bios_vendor', 'bios_version', 'asset_tag', 'uuid', 'manufacturer'), ''
+    )
+    if dmidcd:
+        if dmidcd.bios:
+            fields['bios_vendor'] = dmidcd.bios.get('vendor', '')
+            fields['bios_version'] = dmidcd.bios.get('version', '')
+        if hasattr(dmidcd, 'data'):
+            ch_info = dmidcd.data.get('chassis_information', [])
+            if ch_info:
+                fields['asset_tag'] = ch_info[0].get('asset_tag', '')
+        if dmidcd.system_info:
+            fields['uuid'] = dmidcd.system_info.get('uuid', '')
+            fields['manufacturer'] = dmidcd.system_info.get('manufacturer', '')
+    return fields
+
+
 class CloudProviderInstance(object):
     """
     Class to represent a base cloud provider instance
@@ -76,12 +101,17 @@ class CloudProviderInstance(object):
             this cloud provider.
 
     """
-    def __init__(self, rpms=None, dmidcd=None, yum_repos=None, rhsm_cfg=None):
+    # RPM signature string is kept at class level so that the combiner can
+    # build one multi-pattern scan out of every provider's signature.
+    rpm = ''
+
+    def __init__(self, rpms=None, dmidcd=None, yum_repos=None, rhsm_cfg=None, rpm_matches=None, dmi_fields=None):
         self._rpms = rpms
         self._dmidcd = dmidcd
         self._yum_repos = yum_repos
         self._rhsm_cfg = rhsm_cfg
-        self.rpm = ''
+        self._rpm_matches = rpm_matches
+        self._dmi_fields = dmi_fields if dmi_fields is not None else _dmi_detection_fields(dmidcd)
         self.yum = ''
         self.bios_vendor_version = ''
         self.manuf = ''
@@ -99,26 +129,18 @@ class CloudProviderInstance(object):
 
     def _get_cp_bios_vendor(self, vendor_version):
         """ str: Returns BIOS vendor string if it matches ``vendor_version`` """
-        vendor = ''
-        if self._dmidcd and self._dmidcd.bios:
-            vendor = (
-                self._dmidcd.bios.get('vendor')
-                if vendor_version and vendor_version in self._dmidcd.bios.get('vendor', '').lower() else ''
-            )
-        return vendor
+        vendor = self._dmi_fields['bios_vendor']
+        return vendor if vendor_version and vendor_version in vendor.lower() else ''
 
     def _get_cp_bios_version(self, vendor_version):
         """ str: Returns BIOS version string if it matches ``vendor_version`` """
-        version = ''
-        if self._dmidcd and self._dmidcd.bios:
-            version = (
-                self._dmidcd.bios.get('version')
-                if vendor_version and vendor_version in self._dmidcd.bios.get('version', '').lower() else ''
-            )
-        return version
+        version = self._dmi_fields['bios_version']
+        return version if vendor_version and vendor_version in version.lower() else ''
 
     def _get_rpm_cp_info(self, rpm):
         """ list: Returns list of RPMs matching ``rpm`` """
+        if self._rpm_matches is not None:
+            return self._rpm_matches.get(rpm, [])
         found_rpms = []
         if self._rpms:
             for key, val in self._rpms.packages.items():
@@ -129,13 +151,8 @@ class CloudProviderInstance(object):
 
     def _get_cp_from_manuf(self, manuf):
         """ str: Returns manufacturer string if it matches ``manuf`` """
-        manufacturer = ''
-        if self._dmidcd and self._dmidcd.system_info:
-            manufacturer = (
-                self._dmidcd.system_info.get('manufacturer')
-                if manuf == self._dmidcd.system_info.get('manufacturer', '').lower() else ''
-            )
-        return manufacturer
+        manufacturer = self._dmi_fields['manufacturer']
+        return manufacturer if manuf == manufacturer.lower() else ''
 
     def _get_cp_from_yum(self, repo_name):
         """ list: Returns list of Yum repos matching ``repo_name`` """
@@ -159,22 +176,13 @@ class CloudProviderInstance(object):
 
     def _get_cp_from_asset_tag(self, asset_tag):
         """ str: Returns asset tag string if it matches ``asset_tag`` """
-        tag = ''
-        if self._dmidcd and hasattr(self._dmidcd, 'data'):
-            ch_info = self._dmidcd.data.get('chassis_information', [])
-            if ch_info:
-                tag = ch_info[0].get('asset_tag') if asset_tag and asset_tag == ch_info[0].get('asset_tag', '') else ''
-        return tag
+        tag = self._dmi_fields['asset_tag']
+        return tag if asset_tag and asset_tag == tag else ''
 
     def _get_cp_from_uuid(self, uuid):
         """ str: Returns UUID string if it matches ``uuid`` """
-        found_uuid = ''
-        if self._dmidcd and self._dmidcd.system_info:
-            found_uuid = (
-                self._dmidcd.system_info.get('uuid')
-                if uuid and self._dmidcd.system_info.get('uuid', '').lower().strip().startswith(uuid) else ''
-            )
-        return found_uuid
+        found_uuid = self._dmi_fields['uuid']
+        return found_uuid if uuid and found_uuid.lower().strip().startswith(uuid) else ''
 
     @property
     def name(self):
@@ -196,9 +204,10 @@ class GoogleCloudProvider(CloudProviderInstance):
     _NAME = 'google'
     _LONG_NAME = 'Google Cloud'
 
+    rpm = 'google-rhui-client'
+
     def __init__(self, *args, **kwargs):
         super(GoogleCloudProvider, self).__init__(*args, **kwargs)
-        self.rpm = 'google-rhui-client'
         self.bios_vendor_version = 'google'
         self.cp_bios_vendor = self._get_cp_bios_vendor(self.bios_vendor_version)
         self.cp_bios_version = self._get_cp_bios_version(self.bios_vendor_version)
@@ -230,9 +239,10 @@ class AmazonCloudProvider(CloudProviderInstance):
     _NAME = 'aws'
     _LONG_NAME = 'Amazon Web Services'
 
+    rpm = 'rh-amazon-rhui-client'
+
     def __init__(self, *args, **kwargs):
         super(AmazonCloudProvider, self).__init__(*args, **kwargs)
-        self.rpm = 'rh-amazon-rhui-client'
         self.bios_vendor_version = 'amazon'
         self.uuid = 'ec2'
         self.cp_bios_vendor = self._get_cp_bios_vendor(self.bios_vendor_version)
@@ -250,9 +260,10 @@ class AzureCloudProvider(CloudProviderInstance):
     _NAME = 'azure'
     _LONG_NAME = 'Microsoft Azure'
 
+    rpm = 'walinuxagent'
+
     def __init__(self, *args, **kwargs):
         super(AzureCloudProvider, self).__init__(*args, **kwargs)
-        self.rpm = 'walinuxagent'
         self.yum = 'rhui-microsoft-azure'
         self.asset_tag = '7783-7084-3265-9085-8269-3286-77'
         self.cp_asset_tag = self._get_cp_from_asset_tag(self.asset_tag)
@@ -333,9 +344,17 @@ class CloudProvider(object):
         IBMCloudProvider,
     ]
 
+    # One alternation of every provider's RPM signature, so the installed
+    # package list is scanned once for all providers instead of once per
+    # provider.
+    _RPM_SIG_RE = re.compile('|'.join(re.escape(cls.rpm) for cls in _CLOUD_PROVIDER_CLASSES if cls.rpm))
+
     def __init__(self, rpms, dmidcd, yrl, rhsm_cfg):
+        rpm_matches = self._scan_rpm_signatures(rpms)
+        dmi_fields = _dmi_detection_fields(dmidcd)
         self._cp_objects = dict([
-            (cls._NAME, cls(rpms=rpms, dmidcd=dmidcd, yum_repos=yrl, rhsm_cfg=rhsm_cfg))
+            (cls._NAME, cls(rpms=rpms, dmidcd=dmidcd, yum_repos=yrl, rhsm_cfg=rhsm_cfg,
+                            rpm_matches=rpm_matches, dmi_fields=dmi_fields))
             for cls in self._CLOUD_PROVIDER_CLASSES
         ])
         self.cp_bios_vendor = dict([(name, cp.cp_bios_vendor) for name, cp in self._cp_objects.items()])
@@ -348,6 +367,25 @@ class CloudProvider(object):
         self.cp_rhsm_server_hostname = dict([(name, cp.cp_rhsm_server_hostname) for name, cp in self._cp_objects.items()])
         self.cloud_provider = self._select_provider()
 
+    @classmethod
+    def _scan_rpm_signatures(cls, rpms):
+        """
+        dict: Maps each provider RPM signature to the list of installed
+        packages matching it, collected in a single pass over the package
+        names.
+        """
+        matches = {}
+        if rpms:
+            # InstalledRpms already indexes the packages by short name, so
+            # match the signatures against each unique name once instead of
+            # searching every name-version-release string.
+            match = cls._RPM_SIG_RE.match
+            for name, pkgs in rpms.packages.items():
+                hit = match(name.lower())
+                if hit:
+                    matches.setdefault(hit.group(0), []).extend(p.package for p in pkgs)
+        return matches
+
     def _select_provider(self):
         """
         This method provides the logic to identify which cloud provider is present.
@@ -0,0 +1,38 @@
+"""
+OVSofctlFlows - Combiner for the OVSofctlDumpFlows parser
+=========================================================
+
+Combiner for the :class:`insights.parsers.ovs_ofctl_dump_flows.OVSofctlDumpFlows`
+parser.
+
+The parser is multioutput, one parser instance for each bridge the
+``/usr/bin/ovs-ofctl dump-flows <bridge-name>`` command was run on.  This
+combiner puts all of them back together and presents them as a dict where
+the keys are the bridge names and the parsed flows are the values.  The
+parser results themselves are computed once per archive by the engine, so
+looking up the flows of a bridge here does not re-parse its file.
+
+This class inherits all methods and attributes from the ``dict`` object.
+
+Examples:
+    >>> type(ovs_flows)
+    <class 'insights.combiners.ovs_ofctl_dump_flows.OVSofctlFlows'>
+    >>> sorted(ovs_flows.keys())
+    ['br-int', 'br0']
+    >>> len(ovs_flows['br0'])
+    2
+"""
+
+from insights.core.plugins import combiner
+from insights.parsers.ovs_ofctl_dump_flows import OVSofctlDumpFlows
+
+
+@combiner(OVSofctlDumpFlows)
+class OVSofctlFlows(dict):
+    """
+    Combiner for the OVSofctlDumpFlows parser.
+    """
+    def __init__(self, ovs_obj_list):
+        super(OVSofctlFlows, self).__init__()
+        for ovs_obj in ovs_obj_list:
+            self.update({ovs_obj.bridge_name: ovs_obj.flow_dumps})
@@ -0,0 +1,35 @@
+import doctest
+from insights.combiners import ovs_ofctl_dump_flows
+from insights.combiners.ovs_ofctl_dump_flows import OVSofctlFlows
+from insights.parsers.ovs_ofctl_dump_flows import OVSofctlDumpFlows
+from insights.tests import context_wrap
+
+OVS_FLOW_DUMPS_BR0 = """
+cookie=0x0, duration=8.528s, table=0, n_packets=0, n_bytes=0, idle_timeout=60, priority=65535,arp,in_port="s1-eth2",vlan_tci=0x0000,dl_src=62:ee:31:2b:35:7c,dl_dst=a2:72:e7:06:75:2e,arp_spa=10.0.0.2,arp_tpa=10.0.0.3,arp_op=2 actions=output:"s1-eth3"
+cookie=0x0, duration=4.617s, table=0, n_packets=0, n_bytes=0, idle_timeout=60, priority=65535,arp,in_port="s1-eth1",vlan_tci=0x0000,dl_src=d6:fc:9c:e7:a2:f9,dl_dst=a2:72:e7:06:75:2e,arp_spa=10.0.0.1,arp_tpa=10.0.0.3,arp_op=2 actions=output:"s1-eth3"
+""".strip()
+
+OVS_FLOW_DUMPS_BR_INT = """
+cookie=0x0, duration=4.602s, table=0, n_packets=2, n_bytes=196, idle_timeout=60, priority=65535,icmp,in_port="s1-eth1",vlan_tci=0x0000,dl_src=d6:fc:9c:e7:a2:f9,dl_dst=a2:72:e7:06:75:2e,nw_src=10.0.0.1,nw_dst=10.0.0.3,nw_tos=0,icmp_type=0,icmp_code=0 actions=output:"s1-eth3"
+""".strip()
+
+PATH_BR0 = "insights_commands/ovs-ofctl_dump-flows_br0"
+PATH_BR_INT = "insights_commands/ovs-ofctl_dump-flows_br-int"
+
+
+def test_ovs_ofctl_flows():
+    parser1 = OVSofctlDumpFlows(context_wrap(OVS_FLOW_DUMPS_BR0, path=PATH_BR0))
+    parser2 = OVSofctlDumpFlows(context_wrap(OVS_FLOW_DUMPS_BR_INT, path=PATH_BR_INT))
+    ovs_flows = OVSofctlFlows([parser1, parser2])
+    assert ovs_flows is not None
+    assert set(ovs_flows.keys()) == set(["br0", "br-int"])
+    assert ovs_flows["br0"] == parser1.flow_dumps
+    assert ovs_flows["br-int"] == parser2.flow_dumps
+
+
+def test_ovs_ofctl_flows_docs():
+    parser1 = OVSofctlDumpFlows(context_wrap(OVS_FLOW_DUMPS_BR0, path=PATH_BR0))
+    parser2 = OVSofctlDumpFlows(context_wrap(OVS_FLOW_DUMPS_BR_INT, path=PATH_BR_INT))
+    env = {'ovs_flows': OVSofctlFlows([parser1, parser2])}
+    failed, total = doctest.testmod(ovs_ofctl_dump_flows, globs=env)
+    assert failed == 0
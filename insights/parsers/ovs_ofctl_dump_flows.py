@@ -7,10 +7,56 @@ output of command ``/usr/bin/ovs-ofctl dump-flows <bridge-name>``.
 """
 
 
+import re
+
+from six.moves import intern
+
 from insights import CommandParser, parser
-from insights.parsers import SkipException, split_kv_pairs
+from insights.parsers import SkipException
 from insights.specs import Specs
 
+FLOW_KV_PAIR = re.compile(r'([^\s,=]+)=([^\s,]*)')
+
+FLOW_HEADERS = ('NXST_FLOW reply', 'OFPST_FLOW reply')
+
+FLOW_INT_FIELDS = frozenset(['table', 'n_packets', 'n_bytes', 'idle_timeout', 'hard_timeout', 'priority'])
+
+
+def _decode_port(value):
+    """ int or str: Returns the port as an integer if possible, else the unquoted port name. """
+    value = value.strip('"')
+    # Named ports are the common case, so test for digits instead of
+    # paying for a ValueError on every name.
+    return int(value) if value.isdigit() else value
+
+
+class Flow(object):
+    """
+    A single flow from the output of ``ovs-ofctl dump-flows``.
+
+    Using ``__slots__`` instead of a per-flow dict keeps the memory cost of
+    large dumps down to the fields a flow actually carries.
+
+    Attributes:
+        cookie (str): Controller-issued flow identifier.
+        duration (float): Seconds since the flow was added.
+        table (int): Table the flow lives in.
+        n_packets (int): Number of packets that hit the flow.
+        n_bytes (int): Number of bytes that hit the flow.
+        idle_timeout (int): Idle timeout in seconds, or ``None`` if not set.
+        hard_timeout (int): Hard timeout in seconds, or ``None`` if not set.
+        priority (int): Flow priority, or ``None`` if not printed.
+        match (dict): The remaining match fields, keyed by field name.
+        actions (str): The actions clause, or ``None`` if the line had none.
+    """
+    __slots__ = ('cookie', 'duration', 'table', 'n_packets', 'n_bytes',
+                 'idle_timeout', 'hard_timeout', 'priority', 'match', 'actions')
+
+    def __init__(self):
+        for attr in self.__slots__:
+            setattr(self, attr, None)
+        self.match = {}
+
 
 @parser(Specs.ovs_ofctl_dump_flows)
 class OVSofctlDumpFlows(CommandParser):
@@ -25,40 +71,76 @@ class OVSofctlDumpFlows(CommandParser):
             cookie=0x0, duration=4.617s, table=0, n_packets=0, n_bytes=0, idle_timeout=60, priority=65535,arp,in_port="s1-eth1",vlan_tci=0x0000,dl_src=d6:fc:9c:e7:a2:f9,dl_dst=a2:72:e7:06:75:2e,arp_spa=10.0.0.1,arp_tpa=10.0.0.3,arp_op=2 actions=output:"s1-eth3"
 
 
-        Sample parsed output::
-
-            [
-                    { 'cookie': '0x0', 'duration': '8.528s', 'table': '0', 'n_packets': '0', 'n_bytes': '0', 'idle_timeout': '60', 'priority': '65535', 'arp,in_port': 's1-eth2', 'vlan_tci': '0x0000', 'dl_src': '62:ee:31:2b:35:7c', 'dl_dst': 'a2:72:e7:06:75:2e', 'arp_spa': '10.0.0.2', 'arp_tpa': '10.0.0.3', 'arp_op': '2' 'actions=output':'s1-eth3'},
-                    { 'cookie': '0x0', 'duration': '4.617s', 'table': '0', 'n_packets': '0', 'n_bytes': '0', 'idle_timeout': '60', 'priority': '65535', 'arp,in_port': 's1-eth1', 'vlan_tci': '0x0000', 'dl_src': 'd6:fc:9c:e7:a2:f9', 'dl_dst': 'a2:72:e7:06:75:2e', 'arp_spa': '10.0.0.1', 'arp_tpa': '10.0.0.3', 'arp_op': '2' 'actions=output':'s1-eth3'}
-            ]
+        Each line is parsed into a :class:`Flow` with the fixed header fields
+        as attributes, the remaining match fields in its ``match`` dict and
+        the actions clause in ``actions``.
 
         Examples:
             >>> ovs_obj.bridge_name
             'br0'
             >>> len(ovs_obj.flow_dumps)
             2
+            >>> ovs_obj.flow_dumps[0].duration
+            8.528
+            >>> ovs_obj.flow_dumps[0].match['arp_spa']
+            '10.0.0.2'
+            >>> ovs_obj.flow_dumps[0].actions
+            'output:"s1-eth3"'
     """
 
     def parse_content(self, content):
         if not content:
             raise SkipException("Empty Content!")
 
-        self._bridges = []
+        self._bridges = None
 
         # Extract the bridge name
-        try:
-            self._bridge_name = self.file_path.split("ovs-ofctl_dump-flows_")[1]
-        except:
+        _, sep, bridge = (self.file_path or "").rpartition("ovs-ofctl_dump-flows_")
+        if not sep or not bridge:
             raise SkipException("Invalid Path!")
-
-        for line in content:
-            line = line.split(',')
-            flow_list = split_kv_pairs(line, split_on='=')
-            if flow_list:
-                self._bridges.append(flow_list)
-        if not self._bridges:
+        self._bridge_name = bridge
+
+        # ovs-ofctl prints a protocol reply banner before the flows, filter
+        # it out once up front instead of checking every line while parsing.
+        # Lines are only validated here; decoding them is deferred until a
+        # caller actually iterates ``flow_dumps``.
+        self._flow_lines = [
+            l for l in content
+            if "=" in l and not any(h in l for h in FLOW_HEADERS)
+        ]
+        if not self._flow_lines:
             raise SkipException("Invalid Content!")
 
+    def _parse_flow(self, line):
+        """ Flow: Returns the decoded flow for ``line``, or ``None``. """
+        match_part, sep, actions = line.partition("actions=")
+        pairs = FLOW_KV_PAIR.findall(match_part)
+        if not pairs:
+            return None
+        flow = Flow()
+        # Every flow starts with the same handful of header fields, so
+        # decode them with direct branches instead of a per-field
+        # decoder lookup and call.
+        for key, value in pairs:
+            if key in FLOW_INT_FIELDS:
+                setattr(flow, key, int(value))
+            elif key == 'duration':
+                # ovs-ofctl always prints the duration as '<seconds>s',
+                # so slicing off the unit is enough.
+                flow.duration = float(value[:-1])
+            elif key == 'cookie':
+                flow.cookie = value
+            elif key == 'in_port':
+                flow.match['in_port'] = _decode_port(value)
+            else:
+                # The same few field names repeat in every flow; intern
+                # them so each match dict keys a shared string object
+                # instead of a fresh copy per flow.
+                flow.match[intern(key)] = value
+        if sep:
+            flow.actions = actions
+        return flow
+
     @property
     def bridge_name(self):
         """
@@ -70,7 +152,13 @@ class OVSofctlDumpFlows(CommandParser):
     @property
     def flow_dumps(self):
         """
-        (list): It will return list of flows added under bridge else returns
-        empty list `[]` on failure.
+        (list): It will return list of :class:`Flow` objects added under
+        bridge else returns empty list `[]` on failure.  The flows are
+        decoded on first access and cached.
         """
+        if self._bridges is None:
+            self._bridges = [
+                flow for flow in (self._parse_flow(l) for l in self._flow_lines)
+                if flow is not None
+            ]
         return self._bridges